@@ -99,77 +99,81 @@ fn laplaceGaussian(x:f32, y:f32, z:f32, t:f32) -> f32 {
 
 fn implicitFunc(x:f32, y:f32, z:f32, t:f32, funcSelection:u32) -> f32{
 	var v = 0.0;
-	if (funcSelection == 0u) { 
-		v = sphere(x, y, z, t);
-	} else if (funcSelection == 1u) { 
-		v = schwartzSurface(x, y, z, t);
-	} else if (funcSelection == 2u) { 
-		v = blobs(x, y, z, t);
-	} else if (funcSelection == 3u) { 
-		v = klein(x, y, z, t);
-	} else if (funcSelection == 4u) { 
-		v = torus(x, y, z, t);
-	} else if (funcSelection == 5u) { 
-		v = gyroid(x, y, z, t);
-	} else if (funcSelection == 6u) { 
-		v = orthoCircle(x, y, z, t);
-	} else if (funcSelection == 7u) { 
-		v = spiderCage(x, y, z, t);
-	} else if (funcSelection == 8u) { 
-		v = barthSextic(x, y, z, t);
-	} 
+	switch funcSelection {
+		case 0u: { v = sphere(x, y, z, t); }
+		case 1u: { v = schwartzSurface(x, y, z, t); }
+		case 2u: { v = blobs(x, y, z, t); }
+		case 3u: { v = klein(x, y, z, t); }
+		case 4u: { v = torus(x, y, z, t); }
+		case 5u: { v = gyroid(x, y, z, t); }
+		case 6u: { v = orthoCircle(x, y, z, t); }
+		case 7u: { v = spiderCage(x, y, z, t); }
+		case 8u: { v = barthSextic(x, y, z, t); }
+		default: {}
+	}
 
 	return v;
 }
 
 fn getDataRange(funcSelection:u32) -> DataRange{
 	var dr:DataRange;
-	if (funcSelection == 0u) { // sphere
-		dr.xRange = vec2(-2.1, 2.1); 
-		dr.yRange = vec2(-2.1, 2.1);
-		dr.zRange = vec2(-2.1, 2.1);
-		dr.scale = 1.4;
-	} else if (funcSelection == 1u) { // schwartzSurface
-		dr.xRange = vec2(-4.0, 4.0);
-		dr.yRange = vec2(-4.0, 4.0);
-		dr.zRange = vec2(-4.0, 4.0);
-		dr.scale = 0.4;
-	} else if (funcSelection == 2u) { // blobs
-		dr.xRange = vec2(-2.0, 2.0);
-		dr.yRange = vec2(-2.0, 2.0);
-		dr.zRange = vec2(-2.0, 2.0);
-		dr.scale = 1.1;
-	} else if (funcSelection == 3u) { // klein
-		dr.xRange = vec2(-3.5, 3.5);
-		dr.yRange = vec2(-3.5, 3.5);
-		dr.zRange = vec2(-4.5, 4.5);
-		dr.scale = 0.5;
-	} else if (funcSelection == 4u) { // torus
-		dr.xRange = vec2(-4.0, 4.0);
-		dr.yRange = vec2(-4.0, 4.0);
-		dr.zRange = vec2(-1.2, 1.2);
-		dr.scale = 0.6;
-	} else if (funcSelection == 5u) { // gyroid
-	    dr.xRange = vec2(-4.0, 4.0);
-		dr.yRange = vec2(-4.0, 4.0);
-		dr.zRange = vec2(-4.0, 4.0);
-		dr.scale = 0.3;
-	} else if (funcSelection == 6u) { // orthoCircle
-		dr.xRange = vec2(-1.5, 1.5);
-		dr.yRange = vec2(-1.5, 1.5);
-		dr.zRange = vec2(-1.5, 1.5);
-		dr.scale = 1.7;
-	} else if (funcSelection == 7u) { // spiderCage
-		dr.xRange = vec2(-5.0, 5.0);
-		dr.yRange = vec2(-3.0, 3.0);
-		dr.zRange = vec2(-5.0, 5.0);
-		dr.scale = 0.5;
-	} else if (funcSelection == 8u) { // barthSextic
-		dr.xRange = vec2(-2.0, 2.0);
-		dr.yRange = vec2(-2.0, 2.0);
-		dr.zRange = vec2(-2.0, 2.0);
-		dr.scale = 1.7;
-	} 
+	switch funcSelection {
+		case 0u: { // sphere
+			dr.xRange = vec2(-2.1, 2.1);
+			dr.yRange = vec2(-2.1, 2.1);
+			dr.zRange = vec2(-2.1, 2.1);
+			dr.scale = 1.4;
+		}
+		case 1u: { // schwartzSurface
+			dr.xRange = vec2(-4.0, 4.0);
+			dr.yRange = vec2(-4.0, 4.0);
+			dr.zRange = vec2(-4.0, 4.0);
+			dr.scale = 0.4;
+		}
+		case 2u: { // blobs
+			dr.xRange = vec2(-2.0, 2.0);
+			dr.yRange = vec2(-2.0, 2.0);
+			dr.zRange = vec2(-2.0, 2.0);
+			dr.scale = 1.1;
+		}
+		case 3u: { // klein
+			dr.xRange = vec2(-3.5, 3.5);
+			dr.yRange = vec2(-3.5, 3.5);
+			dr.zRange = vec2(-4.5, 4.5);
+			dr.scale = 0.5;
+		}
+		case 4u: { // torus
+			dr.xRange = vec2(-4.0, 4.0);
+			dr.yRange = vec2(-4.0, 4.0);
+			dr.zRange = vec2(-1.2, 1.2);
+			dr.scale = 0.6;
+		}
+		case 5u: { // gyroid
+			dr.xRange = vec2(-4.0, 4.0);
+			dr.yRange = vec2(-4.0, 4.0);
+			dr.zRange = vec2(-4.0, 4.0);
+			dr.scale = 0.3;
+		}
+		case 6u: { // orthoCircle
+			dr.xRange = vec2(-1.5, 1.5);
+			dr.yRange = vec2(-1.5, 1.5);
+			dr.zRange = vec2(-1.5, 1.5);
+			dr.scale = 1.7;
+		}
+		case 7u: { // spiderCage
+			dr.xRange = vec2(-5.0, 5.0);
+			dr.yRange = vec2(-3.0, 3.0);
+			dr.zRange = vec2(-5.0, 5.0);
+			dr.scale = 0.5;
+		}
+		case 8u: { // barthSextic
+			dr.xRange = vec2(-2.0, 2.0);
+			dr.yRange = vec2(-2.0, 2.0);
+			dr.zRange = vec2(-2.0, 2.0);
+			dr.scale = 1.7;
+		}
+		default: {}
+	}
 
 	return dr;
 }
\ No newline at end of file
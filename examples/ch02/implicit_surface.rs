@@ -1,7 +1,7 @@
 use bytemuck::cast_slice;
 use cgmath::{Matrix, Matrix4, SquareMatrix};
 use rand::{rngs::ThreadRng, Rng};
-use std::{collections::HashMap, iter};
+use std::iter;
 use wgpu::{util::DeviceExt, VertexBufferLayout};
 use winit::{
     event::*,
@@ -9,53 +9,52 @@ use winit::{
     window::Window,
 };
 use wgpu_simplified as ws;
-use app2_dockercompose_rust_wgpu_marchingcubes::{colormap, marching_cubes_table};
-
-fn create_color_data(colormap_name: &str) -> Vec<[f32; 4]> {
-    let cdata = colormap::colormap_data(colormap_name);
-    let mut data: Vec<[f32; 4]> = vec![];
-    for i in 0..cdata.len() {
-        data.push([cdata[i][0], cdata[i][1], cdata[i][2], 1.0]);
-    }
-    data
-}
-
-fn surface_type_map() -> HashMap<u32, String> {
-    let mut surface_type = HashMap::new();
-    surface_type.insert(0, String::from("Sphere"));
-    surface_type.insert(1, String::from("Schwartz Surface"));
-    surface_type.insert(2, String::from("Blobs"));
-    surface_type.insert(3, String::from("Klein"));
-    surface_type.insert(4, String::from("Torus"));
-    surface_type.insert(5, String::from("Chmutov"));
-    surface_type.insert(6, String::from("Gyroid"));
-    surface_type.insert(7, String::from("Cube Sphere"));
-    surface_type.insert(8, String::from("Ortho Circle"));
-    surface_type.insert(9, String::from("Spider Cage"));
-    surface_type.insert(10, String::from("Barth Sextic"));
-    surface_type
-}
-
-fn get_surface_type(key: u32) -> String {
-    let map = surface_type_map();
-    map.get(&key).map(|s| s.to_string()).unwrap_or_default()
+use app2_dockercompose_rust_wgpu_marchingcubes::{colormap, gpu_setup, marching_cubes_table};
+
+const CS_VALUE_SOURCE: &str = concat!(
+    include_str!("implicit_func.wgsl"),
+    "\n",
+    include_str!("implicit_value.wgsl")
+);
+const CS_SURFACE_SOURCE: &str = concat!(
+    include_str!("implicit_func.wgsl"),
+    "\n",
+    include_str!("implicit_surface.wgsl")
+);
+
+// must match the case order of implicitFunc in implicit_func.wgsl
+const SURFACE_TYPES: [&str; 9] = [
+    "Sphere",
+    "Schwartz Surface",
+    "Blobs",
+    "Klein",
+    "Torus",
+    "Gyroid",
+    "Ortho Circle",
+    "Spider Cage",
+    "Barth Sextic",
+];
+
+fn get_surface_type(key: u32) -> &'static str {
+    SURFACE_TYPES.get(key as usize).copied().unwrap_or_default()
 }
 
 struct State {
     init: ws::IWgpuInit,
     pipeline: wgpu::RenderPipeline,
-    uniform_bind_groups: Vec<wgpu::BindGroup>,
-    uniform_buffers: Vec<wgpu::Buffer>,
+    uniform_bind_groups: [wgpu::BindGroup; 2],
+    uniform_buffers: [wgpu::Buffer; 3],
 
-    cs_pipelines: Vec<wgpu::ComputePipeline>,
-    cs_vertex_buffers: Vec<wgpu::Buffer>,
+    cs_pipelines: [wgpu::ComputePipeline; 2],
+    cs_vertex_buffers: [wgpu::Buffer; 4],
     cs_index_buffer: wgpu::Buffer,
-    cs_uniform_buffers: Vec<wgpu::Buffer>,
-    cs_bind_groups: Vec<wgpu::BindGroup>,
+    cs_uniform_buffers: [wgpu::Buffer; 5],
+    cs_bind_groups: [wgpu::BindGroup; 2],
 
     view_mat: Matrix4<f32>,
     project_mat: Matrix4<f32>,
-    msaa_texture_view: wgpu::TextureView,
+    vp_mat: Matrix4<f32>,
+    msaa_texture_view: Option<wgpu::TextureView>,
     depth_texture_view: wgpu::TextureView,
     animation_speed: f32,
     rotation_speed: f32,
@@ -72,18 +71,24 @@ struct State {
     rng: ThreadRng,
     t0: std::time::Instant,
     random_shape_change: u32,
+    params_changed: bool,
     fps_counter: ws::FpsCounter,
 }
 
+// this example requests larger buffers than the defaults; main checks the resolution against
+// the same limits before any window is created
+fn required_limits() -> wgpu::Limits {
+    wgpu::Limits {
+        max_storage_buffer_binding_size: 1024 * 1024 * 1024, //1024MB, defaulting to 128MB
+        max_buffer_size: 1024 * 1024 * 1024,                 // 1024MB, defaulting to 256MB
+        max_compute_invocations_per_workgroup: 512,          // dafaulting to 256
+        ..Default::default()
+    }
+}
+
 impl State {
     async fn new(window: &Window, sample_count: u32, resolution: u32, colormap_name: &str) -> Self {
-        let limits = wgpu::Limits {
-            max_storage_buffer_binding_size: 1024 * 1024 * 1024, //1024MB, defaulting to 128MB
-            max_buffer_size: 1024 * 1024 * 1024,                 // 1024MB, defaulting to 256MB
-            max_compute_invocations_per_workgroup: 512,          // dafaulting to 256
-            ..Default::default()
-        };
-        let init = ws::IWgpuInit::new(&window, sample_count, Some(limits)).await;
+        let init = ws::IWgpuInit::new(&window, sample_count, Some(required_limits())).await;
 
         let resol = ws::round_to_multiple(resolution, 8);
         let marching_cube_cells = (resolution - 1) * (resolution - 1) * (resolution - 1);
@@ -91,7 +96,7 @@ impl State {
         let vertex_buffer_size = 4 * vertex_count;
         let index_count = 15 * marching_cube_cells;
         let index_buffer_size = 4 * index_count;
-        println!("resolution = {}", resol);
+        log::info!("resolution = {}", resol);
 
         let vs_shader = init
             .device
@@ -100,22 +105,18 @@ impl State {
             .device
             .create_shader_module(wgpu::include_wgsl!("../ch01/shader_frag.wgsl"));
 
-        let cs_value_file = include_str!("implicit_value.wgsl");
-        let cs_func_file = include_str!("implicit_func.wgsl");
-        let cs_surface_file = include_str!("implicit_surface.wgsl");
-
         let cs_value = init
             .device
             .create_shader_module(wgpu::ShaderModuleDescriptor {
                 label: Some("Compute Value Shader"),
-                source: wgpu::ShaderSource::Wgsl([cs_func_file, cs_value_file].join("\n").into()),
+                source: wgpu::ShaderSource::Wgsl(CS_VALUE_SOURCE.into()),
             });
 
         let cs_comp = init
             .device
             .create_shader_module(wgpu::ShaderModuleDescriptor {
                 label: Some("Compute Surface Shader"),
-                source: wgpu::ShaderSource::Wgsl([cs_func_file, cs_surface_file].join("\n").into()),
+                source: wgpu::ShaderSource::Wgsl(CS_SURFACE_SOURCE.into()),
             });
 
         // uniform data
@@ -124,7 +125,7 @@ impl State {
         let up_direction = cgmath::Vector3::unit_y();
         let light_direction = [-0.5f32, -0.5, -0.5];
 
-        let (view_mat, project_mat, _) = ws::create_vp_mat(
+        let (view_mat, project_mat, vp_mat) = ws::create_vp_mat(
             camera_position,
             look_direction,
             up_direction,
@@ -231,8 +232,7 @@ impl State {
         };
         let pipeline = ppl.new(&init);
 
-        let msaa_texture_view = ws::create_msaa_texture_view(&init);
-        let depth_texture_view = ws::create_depth_view(&init);
+        let (msaa_texture_view, depth_texture_view) = gpu_setup::create_frame_targets(&init);
 
         // create compute pipeline for value
         let volume_elements = resol * resol * resol;
@@ -359,7 +359,7 @@ impl State {
             mapped_at_creation: false,
         });
 
-        let cdata = create_color_data(colormap_name);
+        let cdata = colormap::colormap_data_rgba(colormap_name);
         let cs_colormap_buffer =
             init.device
                 .create_buffer_init(&wgpu::util::BufferInitDescriptor {
@@ -442,32 +442,33 @@ impl State {
         Self {
             init,
             pipeline,
-            uniform_bind_groups: vec![vert_bind_group, frag_bind_group],
-            uniform_buffers: vec![
+            uniform_bind_groups: [vert_bind_group, frag_bind_group],
+            uniform_buffers: [
                 vert_uniform_buffer,
                 light_uniform_buffer,
                 material_uniform_buffer,
             ],
 
-            cs_pipelines: vec![cs_value_pipeline, cs_pipeline],
-            cs_vertex_buffers: vec![
+            cs_pipelines: [cs_value_pipeline, cs_pipeline],
+            cs_vertex_buffers: [
                 cs_value_buffer,
                 cs_position_buffer,
                 cs_normal_buffer,
                 cs_color_buffer,
             ],
             cs_index_buffer,
-            cs_uniform_buffers: vec![
+            cs_uniform_buffers: [
                 cs_value_int_buffer,
                 cs_value_float_buffer,
                 cs_int_buffer,
                 cs_float_buffer,
                 cs_indirect_buffer,
             ],
-            cs_bind_groups: vec![cs_value_bind_group, cs_bind_group],
+            cs_bind_groups: [cs_value_bind_group, cs_bind_group],
 
             view_mat,
             project_mat,
+            vp_mat,
             msaa_texture_view,
             depth_texture_view,
 
@@ -485,12 +486,14 @@ impl State {
             rng: rand::thread_rng(),
             t0: std::time::Instant::now(),
             random_shape_change: 0,
+            params_changed: true,
             fps_counter: ws::FpsCounter::default(),
         }
     }
 
     fn resize(&mut self, new_size: winit::dpi::PhysicalSize<u32>) {
         if new_size.width > 0 && new_size.height > 0 {
+            let size_changed = new_size != self.init.size;
             self.init.size = new_size;
             self.init.config.width = new_size.width;
             self.init.config.height = new_size.height;
@@ -498,11 +501,14 @@ impl State {
                 .surface
                 .configure(&self.init.device, &self.init.config);
 
-            self.project_mat =
-                ws::create_projection_mat(new_size.width as f32 / new_size.height as f32, true);
-            self.depth_texture_view = ws::create_depth_view(&self.init);
-            if self.init.sample_count > 1 {
-                self.msaa_texture_view = ws::create_msaa_texture_view(&self.init);
+            // a lost or outdated surface is reconfigured at the same size;
+            // the projection and depth/msaa views only depend on the size
+            if size_changed {
+                self.project_mat =
+                    ws::create_projection_mat(new_size.width as f32 / new_size.height as f32, true);
+                self.vp_mat = self.project_mat * self.view_mat;
+                (self.msaa_texture_view, self.depth_texture_view) =
+                    gpu_setup::create_frame_targets(&self.init);
             }
         }
     }
@@ -520,8 +526,9 @@ impl State {
                 ..
             } => match keycode {
                 VirtualKeyCode::Space => {
-                    self.surface_type = (self.surface_type + 1) % 9;
-                    println!(
+                    self.surface_type = (self.surface_type + 1) % SURFACE_TYPES.len() as u32;
+                    self.params_changed = true;
+                    log::info!(
                         "key = {:?}, surface_type = {:?}",
                         self.surface_type,
                         get_surface_type(self.surface_type)
@@ -530,6 +537,7 @@ impl State {
                 }
                 VirtualKeyCode::LControl => {
                     self.colormap_direction = (self.colormap_direction + 1) % 4;
+                    self.params_changed = true;
                     true
                 }
                 VirtualKeyCode::LShift => {
@@ -538,6 +546,7 @@ impl State {
                 }
                 VirtualKeyCode::LAlt => {
                     self.colormap_reverse = if self.colormap_reverse == 0 { 1 } else { 0 };
+                    self.params_changed = true;
                     true
                 }
                 VirtualKeyCode::Q => {
@@ -577,29 +586,27 @@ impl State {
             [dt1.sin(), dt1.cos(), 0.0],
             [1.0, 1.0, 1.0],
         );
-        let view_project_mat = self.project_mat * self.view_mat;
-
         let normal_mat = (model_mat.invert().unwrap()).transpose();
 
         let model_ref: &[f32; 16] = model_mat.as_ref();
-        let view_projection_ref: &[f32; 16] = view_project_mat.as_ref();
+        let view_projection_ref: &[f32; 16] = self.vp_mat.as_ref();
         let normal_ref: &[f32; 16] = normal_mat.as_ref();
 
+        // pack vp_mat, model_mat and normal_mat so they go up in a single write
+        let mut vert_uniforms = [0f32; 48];
+        vert_uniforms[..16].copy_from_slice(view_projection_ref);
+        vert_uniforms[16..32].copy_from_slice(model_ref);
+        vert_uniforms[32..].copy_from_slice(normal_ref);
         self.init
             .queue
-            .write_buffer(&self.uniform_buffers[0], 0, cast_slice(view_projection_ref));
-        self.init
-            .queue
-            .write_buffer(&self.uniform_buffers[0], 64, cast_slice(model_ref));
-        self.init
-            .queue
-            .write_buffer(&self.uniform_buffers[0], 128, cast_slice(normal_ref));
+            .write_buffer(&self.uniform_buffers[0], 0, cast_slice(&vert_uniforms));
 
         let elapsed = self.t0.elapsed();
         if elapsed >= std::time::Duration::from_secs(5) && self.random_shape_change == 0 {
-            self.surface_type = self.rng.gen_range(0..=8) as u32;
+            self.surface_type = self.rng.gen_range(0..SURFACE_TYPES.len()) as u32;
             self.t0 = std::time::Instant::now();
-            println!(
+            self.params_changed = true;
+            log::info!(
                 "key = {:?}, surface_type = {:?}",
                 self.surface_type,
                 get_surface_type(self.surface_type)
@@ -607,12 +614,14 @@ impl State {
         }
 
         // update compute buffers for value
-        let value_int_params = [self.resolution, self.surface_type, 0, 0];
-        self.init.queue.write_buffer(
-            &self.cs_uniform_buffers[0],
-            0,
-            cast_slice(&value_int_params),
-        );
+        if self.params_changed {
+            let value_int_params = [self.resolution, self.surface_type, 0, 0];
+            self.init.queue.write_buffer(
+                &self.cs_uniform_buffers[0],
+                0,
+                cast_slice(&value_int_params),
+            );
+        }
 
         let value_float_params = [self.animation_speed * dt.as_secs_f32(), 0.0, 0.0, 0.0];
         self.init.queue.write_buffer(
@@ -621,34 +630,27 @@ impl State {
             cast_slice(&value_float_params),
         );
 
-        // update compute buffers for implicit surface
-        let int_params = [
-            self.resolution,
-            self.surface_type,
-            self.colormap_direction,
-            self.colormap_reverse,
-        ];
-        self.init
-            .queue
-            .write_buffer(&self.cs_uniform_buffers[2], 0, cast_slice(&int_params));
-
-        let float_params = [self.isolevel, self.scale, 0.0, 0.0];
-        self.init
-            .queue
-            .write_buffer(&self.cs_uniform_buffers[3], 0, cast_slice(&float_params));
+        // update compute buffers for implicit surface, only when their inputs have changed
+        if self.params_changed {
+            let int_params = [
+                self.resolution,
+                self.surface_type,
+                self.colormap_direction,
+                self.colormap_reverse,
+            ];
+            self.init
+                .queue
+                .write_buffer(&self.cs_uniform_buffers[2], 0, cast_slice(&int_params));
 
-        let indirect_array = [500u32, 0, 0, 0];
-        self.init
-            .queue
-            .write_buffer(&self.cs_uniform_buffers[4], 0, cast_slice(&indirect_array));
+            let float_params = [self.isolevel, self.scale, 0.0, 0.0];
+            self.init
+                .queue
+                .write_buffer(&self.cs_uniform_buffers[3], 0, cast_slice(&float_params));
+            self.params_changed = false;
+        }
     }
 
     fn render(&mut self) -> Result<(), wgpu::SurfaceError> {
-        let output = self.init.surface.get_current_texture()?;
-        let view = output
-            .texture
-            .create_view(&wgpu::TextureViewDescriptor::default());
-
         let mut encoder =
             self.init
                 .device
@@ -656,6 +658,9 @@ impl State {
                     label: Some("Render Encoder"),
                 });
 
+        // reset the vertex counter on the GPU instead of uploading it every frame
+        encoder.clear_buffer(&self.cs_uniform_buffers[4], 0, None);
+
         // compute pass for value
         {
             let mut cs_index_pass = encoder.begin_compute_pass(&wgpu::ComputePassDescriptor {
@@ -684,14 +689,19 @@ impl State {
             );
         }
 
+        // acquire the swapchain image as late as possible, after the compute passes
+        let output = self.init.surface.get_current_texture()?;
+        let view = output
+            .texture
+            .create_view(&wgpu::TextureViewDescriptor::default());
+
         // render pass
         {
-            let color_attach = ws::create_color_attachment(&view);
-            let msaa_attach = ws::create_msaa_color_attachment(&view, &self.msaa_texture_view);
-            let color_attachment = if self.init.sample_count == 1 {
-                color_attach
-            } else {
-                msaa_attach
+            let color_attachment = match &self.msaa_texture_view {
+                Some(msaa_texture_view) => {
+                    ws::create_msaa_color_attachment(&view, msaa_texture_view)
+                }
+                None => ws::create_color_attachment(&view),
             };
             let depth_attachment = ws::create_depth_stencil_attachment(&self.depth_texture_view);
 
@@ -733,13 +743,19 @@ fn main() {
     if args.len() > 3 {
         colormap_name = &args[3];
     }
-
-    env_logger::init();
+    gpu_setup::check_resolution(resolution, &required_limits());
+
+    // show this example's resolution and surface-switch messages by default, but keep
+    // wgpu and naga at warn; RUST_LOG still overrides it
+    env_logger::Builder::from_env(
+        env_logger::Env::default().default_filter_or("warn,implicit_surface=info"),
+    )
+    .init();
     let event_loop = EventLoop::new();
     let window = winit::window::WindowBuilder::new()
         .build(&event_loop)
         .unwrap();
-    window.set_title(&*format!("{}", "implict_surface"));
+    window.set_title("implict_surface");
 
     let mut state =
         pollster::block_on(State::new(&window, sample_count, resolution, colormap_name));
@@ -779,9 +795,12 @@ fn main() {
 
             match state.render() {
                 Ok(_) => {}
-                Err(wgpu::SurfaceError::Lost) => state.resize(state.init.size),
+                Err(wgpu::SurfaceError::Lost | wgpu::SurfaceError::Outdated) => {
+                    state.resize(state.init.size)
+                }
                 Err(wgpu::SurfaceError::OutOfMemory) => *control_flow = ControlFlow::Exit,
-                Err(e) => eprintln!("{:?}", e),
+                // the presentation engine was slow; drop this frame and try again on the next one
+                Err(wgpu::SurfaceError::Timeout) => log::warn!("surface timeout, skipping frame"),
             }
         }
         Event::MainEventsCleared => {
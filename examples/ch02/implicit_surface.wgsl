@@ -49,12 +49,15 @@ fn valueAt(index: vec3u) -> f32 {
     return valueBuffer[idx];
 }
 
-fn positionAt(index: vec3u) -> vec3f {
+fn setDataRange() {
     let dr = getDataRange(ips.funcSelection);
     scale2 = dr.scale;
     vmin = vec3(dr.xRange[0], dr.yRange[0], dr.zRange[0]);
     vmax = vec3(dr.xRange[1], dr.yRange[1], dr.zRange[1]);
     vstep = (vmax - vmin)/(f32(ips.resolution) - 1.0);
+}
+
+fn positionAt(index: vec3u) -> vec3f {
     return vmin + (vstep * vec3<f32>(index.xyz));
 }
 
@@ -135,6 +138,8 @@ fn colorLerp(tmin: f32, tmax: f32, t: f32, colormapReverse: u32) -> vec4f{
 
 @compute @workgroup_size(8, 8, 8)
 fn cs_main(@builtin(global_invocation_id) global_id: vec3u) {
+    setDataRange();
+
     let i0 = global_id;
     let i1 = global_id + vec3(1u, 0u, 0u);
     let i2 = global_id + vec3(1u, 1u, 0u);
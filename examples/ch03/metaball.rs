@@ -1,6 +1,6 @@
 use bytemuck::cast_slice;
 use cgmath::{Matrix, Matrix4, SquareMatrix};
-use rand::{distributions::Uniform, Rng};
+use rand::{distributions::Uniform, rngs::ThreadRng, Rng};
 use std::iter;
 use wgpu::{util::DeviceExt, VertexBufferLayout};
 use winit::{
@@ -9,16 +9,7 @@ use winit::{
     window::Window,
 };
 use wgpu_simplified as ws;
-use app2_dockercompose_rust_wgpu_marchingcubes::{colormap, marching_cubes_table};
-
-fn create_color_data(colormap_name: &str) -> Vec<[f32; 4]> {
-    let cdata = colormap::colormap_data(colormap_name);
-    let mut data: Vec<[f32; 4]> = vec![];
-    for i in 0..cdata.len() {
-        data.push([cdata[i][0], cdata[i][1], cdata[i][2], 1.0]);
-    }
-    data
-}
+use app2_dockercompose_rust_wgpu_marchingcubes::{colormap, gpu_setup, marching_cubes_table};
 
 #[derive(Clone, Debug)]
 struct MetaballPosition {
@@ -34,18 +25,18 @@ struct MetaballPosition {
 struct State {
     init: ws::IWgpuInit,
     pipeline: wgpu::RenderPipeline,
-    uniform_bind_groups: Vec<wgpu::BindGroup>,
-    uniform_buffers: Vec<wgpu::Buffer>,
+    uniform_bind_groups: [wgpu::BindGroup; 2],
+    uniform_buffers: [wgpu::Buffer; 3],
 
-    cs_pipelines: Vec<wgpu::ComputePipeline>,
-    cs_vertex_buffers: Vec<wgpu::Buffer>,
+    cs_pipelines: [wgpu::ComputePipeline; 2],
+    cs_vertex_buffers: [wgpu::Buffer; 4],
     cs_index_buffer: wgpu::Buffer,
-    cs_uniform_buffers: Vec<wgpu::Buffer>,
-    cs_bind_groups: Vec<wgpu::BindGroup>,
+    cs_uniform_buffers: [wgpu::Buffer; 5],
+    cs_bind_groups: [wgpu::BindGroup; 2],
 
     view_mat: Matrix4<f32>,
     project_mat: Matrix4<f32>,
-    msaa_texture_view: wgpu::TextureView,
+    msaa_texture_view: Option<wgpu::TextureView>,
     depth_texture_view: wgpu::TextureView,
 
     resolution: u32,
@@ -64,18 +55,26 @@ struct State {
     subtract: f32,
     subtract_target: f32,
     start: std::time::Instant,
+    rng: ThreadRng,
+    range: Uniform<f32>,
     t0: std::time::Instant,
+    params_changed: bool,
     fps_counter: ws::FpsCounter,
 }
 
+// this example requests larger buffers than the defaults; main checks the resolution against
+// the same limits before any window is created
+fn required_limits() -> wgpu::Limits {
+    wgpu::Limits {
+        max_storage_buffer_binding_size: 1073741820,//1024 * 1024 * 1024, //1024MB, defaulting to 128MB ### JEDIT 1 ###
+        max_buffer_size: 1024 * 1024 * 1024,                 // 1024MB, defaulting to 256MB
+        ..Default::default()
+    }
+}
+
 impl State {
     async fn new(window: &Window, sample_count: u32, resolution: u32, colormap_name: &str) -> Self {
-        let limits = wgpu::Limits {
-            max_storage_buffer_binding_size: 1073741820,//1024 * 1024 * 1024, //1024MB, defaulting to 128MB ### JEDIT 1 ###
-            max_buffer_size: 1024 * 1024 * 1024,                 // 1024MB, defaulting to 256MB
-            ..Default::default()
-        };
-        let init = ws::IWgpuInit::new(&window, sample_count, Some(limits)).await;
+        let init = ws::IWgpuInit::new(&window, sample_count, Some(required_limits())).await;
         //let init = ws::IWgpuInit::new(&window, sample_count, None).await;
 
         let resol = ws::round_to_multiple(resolution, 4);
@@ -85,7 +84,7 @@ impl State {
         let vertex_buffer_size = 4 * vertex_count;
         let index_count = 15 * marching_cube_cells;
         let index_buffer_size = 4 * index_count;
-        println!("resolution = {}", resol);
+        log::info!("resolution = {}", resol);
 
         let vs_shader = init
             .device
@@ -125,21 +124,12 @@ impl State {
             usage: wgpu::BufferUsages::UNIFORM | wgpu::BufferUsages::COPY_DST,
             mapped_at_creation: false,
         });
-        init.queue.write_buffer(
-            &vert_uniform_buffer,
-            0,
-            cast_slice(vp_mat.as_ref() as &[f32; 16]),
-        );
-        init.queue.write_buffer(
-            &vert_uniform_buffer,
-            64,
-            cast_slice(model_mat.as_ref() as &[f32; 16]),
-        );
-        init.queue.write_buffer(
-            &vert_uniform_buffer,
-            128,
-            cast_slice(normal_mat.as_ref() as &[f32; 16]),
-        );
+        let mut vert_uniforms = [0f32; 48];
+        vert_uniforms[..16].copy_from_slice(vp_mat.as_ref() as &[f32; 16]);
+        vert_uniforms[16..32].copy_from_slice(model_mat.as_ref() as &[f32; 16]);
+        vert_uniforms[32..].copy_from_slice(normal_mat.as_ref() as &[f32; 16]);
+        init.queue
+            .write_buffer(&vert_uniform_buffer, 0, cast_slice(&vert_uniforms));
 
         // create light uniform buffer. here we set eye_position = camera_position
         let light_uniform_buffer = init.device.create_buffer(&wgpu::BufferDescriptor {
@@ -231,8 +221,7 @@ impl State {
         };
         let pipeline = ppl.new(&init);
 
-        let msaa_texture_view = ws::create_msaa_texture_view(&init);
-        let depth_texture_view = ws::create_depth_view(&init);
+        let (msaa_texture_view, depth_texture_view) = gpu_setup::create_frame_targets(&init);
 
         // create compute pipeline for value
         let volume_elements = resol * resol * resol;
@@ -383,7 +372,7 @@ impl State {
             mapped_at_creation: false,
         });
 
-        let cdata = create_color_data(colormap_name);
+        let cdata = colormap::colormap_data_rgba(colormap_name);
         let cs_colormap_buffer =
             init.device
                 .create_buffer_init(&wgpu::util::BufferInitDescriptor {
@@ -466,29 +455,29 @@ impl State {
         Self {
             init,
             pipeline,
-            uniform_bind_groups: vec![vert_bind_group, frag_bind_group],
-            uniform_buffers: vec![
+            uniform_bind_groups: [vert_bind_group, frag_bind_group],
+            uniform_buffers: [
                 vert_uniform_buffer,
                 light_uniform_buffer,
                 material_uniform_buffer,
             ],
 
-            cs_pipelines: vec![cs_value_pipeline, cs_pipeline],
-            cs_vertex_buffers: vec![
+            cs_pipelines: [cs_value_pipeline, cs_pipeline],
+            cs_vertex_buffers: [
                 cs_value_buffer,
                 cs_position_buffer,
                 cs_normal_buffer,
                 cs_color_buffer,
             ],
             cs_index_buffer,
-            cs_uniform_buffers: vec![
+            cs_uniform_buffers: [
                 cs_value_int_buffer,
                 cs_value_metaball_buffer,
                 cs_int_buffer,
                 cs_float_buffer,
                 cs_indirect_buffer,
             ],
-            cs_bind_groups: vec![cs_value_bind_group, cs_bind_group],
+            cs_bind_groups: [cs_value_bind_group, cs_bind_group],
 
             view_mat,
             project_mat,
@@ -511,13 +500,17 @@ impl State {
             subtract: 1.0,
             subtract_target: 1.0,
             start: std::time::Instant::now(),
+            rng,
+            range,
             t0: std::time::Instant::now(),
+            params_changed: true,
             fps_counter: ws::FpsCounter::default(),
         }
     }
 
     fn resize(&mut self, new_size: winit::dpi::PhysicalSize<u32>) {
         if new_size.width > 0 && new_size.height > 0 {
+            let size_changed = new_size != self.init.size;
             self.init.size = new_size;
             self.init.config.width = new_size.width;
             self.init.config.height = new_size.height;
@@ -525,18 +518,20 @@ impl State {
                 .surface
                 .configure(&self.init.device, &self.init.config);
 
-            self.project_mat =
-                ws::create_projection_mat(new_size.width as f32 / new_size.height as f32, true);
-            let vp_mat = self.project_mat * self.view_mat;
-            self.init.queue.write_buffer(
-                &self.uniform_buffers[0],
-                0,
-                bytemuck::cast_slice(vp_mat.as_ref() as &[f32; 16]),
-            );
-
-            self.depth_texture_view = ws::create_depth_view(&self.init);
-            if self.init.sample_count > 1 {
-                self.msaa_texture_view = ws::create_msaa_texture_view(&self.init);
+            // a lost or outdated surface is reconfigured at the same size;
+            // the projection and depth/msaa views only depend on the size
+            if size_changed {
+                self.project_mat =
+                    ws::create_projection_mat(new_size.width as f32 / new_size.height as f32, true);
+                let vp_mat = self.project_mat * self.view_mat;
+                self.init.queue.write_buffer(
+                    &self.uniform_buffers[0],
+                    0,
+                    bytemuck::cast_slice(vp_mat.as_ref() as &[f32; 16]),
+                );
+
+                (self.msaa_texture_view, self.depth_texture_view) =
+                    gpu_setup::create_frame_targets(&self.init);
             }
         }
     }
@@ -555,10 +550,12 @@ impl State {
             } => match keycode {
                 VirtualKeyCode::Space => {
                     self.colormap_direction = (self.colormap_direction + 1) % 4;
+                    self.params_changed = true;
                     true
                 }
                 VirtualKeyCode::LControl => {
                     self.colormap_reverse = if self.colormap_reverse == 0 { 1 } else { 0 };
+                    self.params_changed = true;
                     true
                 }
                 _ => false,
@@ -569,12 +566,14 @@ impl State {
 
     fn update(&mut self, _dt: std::time::Duration) {
         // update compute buffers for value
-        let value_int_params = [self.resolution, self.metaballs_count, 0, 0];
-        self.init.queue.write_buffer(
-            &self.cs_uniform_buffers[0],
-            0,
-            bytemuck::cast_slice(&value_int_params),
-        );
+        if self.params_changed {
+            let value_int_params = [self.resolution, self.metaballs_count, 0, 0];
+            self.init.queue.write_buffer(
+                &self.cs_uniform_buffers[0],
+                0,
+                bytemuck::cast_slice(&value_int_params),
+            );
+        }
 
         let time = std::time::Instant::now();
         let dt1 = (time - self.start).as_secs_f32();
@@ -583,9 +582,14 @@ impl State {
         self.subtract += (self.subtract_target - self.subtract) * dt1 * 0.2;
         self.strength += (self.strength_target - self.strength) * dt1 * 0.2;
 
-        for i in 0..self.metaballs_count as usize {
-            let mbp = &mut self.metaball_positions[i];
-
+        let (strength, subtract) = (self.strength, self.subtract);
+        let radius = (strength / subtract).sqrt();
+        let sz = 3.1f32;
+        for (mbp, ball) in self
+            .metaball_positions
+            .iter_mut()
+            .zip(self.metaball_array.chunks_exact_mut(8))
+        {
             mbp.vx += -mbp.x * mbp.speed * 20.0;
             mbp.vy += -mbp.y * mbp.speed * 20.0;
             mbp.vz += -mbp.z * mbp.speed * 20.0;
@@ -594,7 +598,6 @@ impl State {
             mbp.y += mbp.vy * dt1 * 0.0001;
             mbp.z += mbp.vz * dt1 * 0.0001;
 
-            let sz = 3.1f32;
             if mbp.x > sz {
                 mbp.x = sz;
                 mbp.vx *= -1.0;
@@ -618,17 +621,13 @@ impl State {
                 mbp.z = -sz;
                 mbp.vz *= -1.0;
             }
-        }
 
-        for i in 0..self.metaballs_count as usize {
-            let mbp = &mut self.metaball_positions[i];
-            let offset = i * 8;
-            self.metaball_array[offset] = mbp.x;
-            self.metaball_array[offset + 1] = mbp.y;
-            self.metaball_array[offset + 2] = mbp.z;
-            self.metaball_array[offset + 3] = (self.strength / self.subtract).sqrt(); // radius
-            self.metaball_array[offset + 4] = self.strength;
-            self.metaball_array[offset + 5] = self.subtract;
+            ball[0] = mbp.x;
+            ball[1] = mbp.y;
+            ball[2] = mbp.z;
+            ball[3] = radius;
+            ball[4] = strength;
+            ball[5] = subtract;
         }
 
         self.init.queue.write_buffer(
@@ -637,48 +636,38 @@ impl State {
             bytemuck::cast_slice(&self.metaball_array),
         );
 
-        // update compute buffers
-        let int_params = [
-            self.resolution,
-            self.colormap_direction,
-            self.colormap_reverse,
-        ];
-        self.init.queue.write_buffer(
-            &self.cs_uniform_buffers[2],
-            0,
-            bytemuck::cast_slice(&int_params),
-        );
-
-        let float_params = [self.isolevel, self.scale, 0.0, 0.0];
-        self.init.queue.write_buffer(
-            &self.cs_uniform_buffers[3],
-            0,
-            bytemuck::cast_slice(&float_params),
-        );
+        // update compute buffers, only when their inputs have changed
+        if self.params_changed {
+            let int_params = [
+                self.resolution,
+                self.colormap_direction,
+                self.colormap_reverse,
+            ];
+            self.init.queue.write_buffer(
+                &self.cs_uniform_buffers[2],
+                0,
+                bytemuck::cast_slice(&int_params),
+            );
 
-        let indirect_array = [500u32, 0, 0, 0];
-        self.init.queue.write_buffer(
-            &self.cs_uniform_buffers[4],
-            0,
-            bytemuck::cast_slice(&indirect_array),
-        );
+            let float_params = [self.isolevel, self.scale, 0.0, 0.0];
+            self.init.queue.write_buffer(
+                &self.cs_uniform_buffers[3],
+                0,
+                bytemuck::cast_slice(&float_params),
+            );
+            self.params_changed = false;
+        }
 
         // update strength and subtract parameters in every 5 secs
         let elapsed = self.t0.elapsed();
-        let mut rng = rand::thread_rng();
-        let range = Uniform::new(0.0, 1.0);
         if elapsed >= std::time::Duration::from_secs(5) {
-            self.subtract_target = 3.0 * rng.sample(range) + 3.0;
-            self.strength_target = 3.0 * rng.sample(range) + 3.0;
+            self.subtract_target = 3.0 * self.rng.sample(self.range) + 3.0;
+            self.strength_target = 3.0 * self.rng.sample(self.range) + 3.0;
+            self.t0 = std::time::Instant::now();
         }
     }
 
     fn render(&mut self) -> Result<(), wgpu::SurfaceError> {
-        let output = self.init.surface.get_current_texture()?;
-        let view = output
-            .texture
-            .create_view(&wgpu::TextureViewDescriptor::default());
-
         let mut encoder =
             self.init
                 .device
@@ -686,6 +675,9 @@ impl State {
                     label: Some("Render Encoder"),
                 });
 
+        // reset the vertex counter on the GPU instead of uploading it every frame
+        encoder.clear_buffer(&self.cs_uniform_buffers[4], 0, None);
+
         // compute pass for value
         {
             let mut cs_index_pass = encoder.begin_compute_pass(&wgpu::ComputePassDescriptor {
@@ -714,14 +706,19 @@ impl State {
             );
         }
 
+        // acquire the swapchain image as late as possible, after the compute passes
+        let output = self.init.surface.get_current_texture()?;
+        let view = output
+            .texture
+            .create_view(&wgpu::TextureViewDescriptor::default());
+
         // render pass
         {
-            let color_attach = ws::create_color_attachment(&view);
-            let msaa_attach = ws::create_msaa_color_attachment(&view, &self.msaa_texture_view);
-            let color_attachment = if self.init.sample_count == 1 {
-                color_attach
-            } else {
-                msaa_attach
+            let color_attachment = match &self.msaa_texture_view {
+                Some(msaa_texture_view) => {
+                    ws::create_msaa_color_attachment(&view, msaa_texture_view)
+                }
+                None => ws::create_color_attachment(&view),
             };
             let depth_attachment = ws::create_depth_stencil_attachment(&self.depth_texture_view);
 
@@ -763,13 +760,19 @@ fn main() {
     if args.len() > 3 {
         colormap_name = &args[3];
     }
-
-    env_logger::init();
+    gpu_setup::check_resolution(resolution, &required_limits());
+
+    // show this example's resolution and surface-switch messages by default, but keep
+    // wgpu and naga at warn; RUST_LOG still overrides it
+    env_logger::Builder::from_env(
+        env_logger::Env::default().default_filter_or("warn,metaball=info"),
+    )
+    .init();
     let event_loop = EventLoop::new();
     let window = winit::window::WindowBuilder::new()
         .build(&event_loop)
         .unwrap();
-    window.set_title(&*format!("{}", "metaball"));
+    window.set_title("metaball");
 
     let mut state =
         pollster::block_on(State::new(&window, sample_count, resolution, colormap_name));
@@ -809,9 +812,12 @@ fn main() {
 
             match state.render() {
                 Ok(_) => {}
-                Err(wgpu::SurfaceError::Lost) => state.resize(state.init.size),
+                Err(wgpu::SurfaceError::Lost | wgpu::SurfaceError::Outdated) => {
+                    state.resize(state.init.size)
+                }
                 Err(wgpu::SurfaceError::OutOfMemory) => *control_flow = ControlFlow::Exit,
-                Err(e) => eprintln!("{:?}", e),
+                // the presentation engine was slow; drop this frame and try again on the next one
+                Err(wgpu::SurfaceError::Timeout) => log::warn!("surface timeout, skipping frame"),
             }
         }
         Event::MainEventsCleared => {
@@ -33,8 +33,8 @@ struct FloatParams {
 };
 @group(0) @binding(9) var<uniform> fps: FloatParams;
 
-var<private> vmin: vec3f;
-var<private> vmax: vec3f;
+const vmin = vec3f(-4.0, -4.0, -4.0);
+const vmax = vec3f(4.0, 4.0, 4.0);
 var<private> vstep: vec3f;
 
 fn getIdx(id: vec3u) -> u32 {
@@ -48,9 +48,6 @@ fn valueAt(index: vec3u) -> f32 {
 }
 
 fn positionAt(index: vec3u) -> vec3f {
-    vmin = vec3(-4.0, -4.0, -4.0);
-    vmax = vec3(4.0, 4.0, 4.0);
-    vstep = (vmax - vmin)/(f32(ips.resolution) - 1.0);
     return vmin + (vstep * vec3<f32>(index.xyz));
 }
 
@@ -131,6 +128,8 @@ fn colorLerp(tmin: f32, tmax: f32, t: f32, colormapReverse: u32) -> vec4f{
 
 @compute @workgroup_size(4, 4, 4)
 fn cs_main(@builtin(global_invocation_id) global_id: vec3u) {
+    vstep = (vmax - vmin)/(f32(ips.resolution) - 1.0);
+
     let i0 = global_id;
     let i1 = global_id + vec3(1u, 0u, 0u);
     let i2 = global_id + vec3(1u, 1u, 0u);
@@ -28,11 +28,9 @@ fn surfaceFunc(position : vec3f) -> f32 {
     var res = 0.0;
     for(var i = 0u; i < ips.metaballCount; i = i + 1u){
         let ball = metaballs[i];
-        let dist = distance(position, ball.position);
-        let val = ball.strength / (0.000001 + dist * dist) - ball.subtract;
-        if(val > 0.0){
-            res = res + val;
-        }
+        let d = position - ball.position;
+        let val = ball.strength / (0.000001 + dot(d, d)) - ball.subtract;
+        res = res + max(val, 0.0);
     }   
     return res;
 }
@@ -107,11 +107,10 @@ pub fn colormap_data(colormap_name: &str) -> [[f32; 3]; 11] {
     colors
 }
 
+pub fn colormap_data_rgba(colormap_name: &str) -> [[f32; 4]; 11] {
+    colormap_data(colormap_name).map(|c| [c[0], c[1], c[2], 1.0])
+}
+
 fn convert_f32(a: [[i32; 3]; 11]) -> [[f32; 3]; 11] {
-    let b: Vec<[f32;3]> = a.iter().map(|&c| [c[0] as f32, c[1] as f32, c[2] as f32]).collect();
-    let mut arr:[[f32; 3]; 11] = [[0.0; 3]; 11];
-    for i in 0..11 {
-        arr[i] = b[i].clone();
-    }
-    arr
+    a.map(|c| [c[0] as f32, c[1] as f32, c[2] as f32])
 }
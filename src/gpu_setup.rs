@@ -0,0 +1,36 @@
+use wgpu_simplified as ws;
+
+// depth and msaa views share the surface size, so they are (re)created together;
+// the msaa view only exists when multisampling is enabled
+pub fn create_frame_targets(
+    init: &ws::IWgpuInit,
+) -> (Option<wgpu::TextureView>, wgpu::TextureView) {
+    let msaa_texture_view = if init.sample_count > 1 {
+        Some(ws::create_msaa_texture_view(init))
+    } else {
+        None
+    };
+    (msaa_texture_view, ws::create_depth_view(init))
+}
+
+// the vertex buffer (12 vertices x 3 floats per cell) is the largest one; size it with checked
+// u64 math, as it overflows even u64 at large resolutions; call it before creating the window
+pub fn check_resolution(resolution: u32, limits: &wgpu::Limits) {
+    assert!(
+        resolution >= 2,
+        "resolution must be at least 2, got {}",
+        resolution
+    );
+    let max_size = limits
+        .max_buffer_size
+        .min(limits.max_storage_buffer_binding_size as u64);
+    let vertex_buffer_size = (resolution as u64 - 1)
+        .checked_pow(3)
+        .and_then(|cells| cells.checked_mul(4 * 3 * 12));
+    assert!(
+        matches!(vertex_buffer_size, Some(size) if size <= max_size),
+        "resolution {} needs a vertex buffer exceeding the {} byte limit",
+        resolution,
+        max_size
+    );
+}
@@ -2,4 +2,5 @@ pub mod vertex_data;
 pub mod colormap;
 pub mod math_func;
 pub mod surface_data;
-pub mod marching_cubes_table;
\ No newline at end of file
+pub mod marching_cubes_table;
+pub mod gpu_setup;
\ No newline at end of file
@@ -34,37 +34,38 @@ pub struct IParametricSurface {
     pub uv_lens: [f32; 2],
 }
 
+const SURFACE_TYPES: [&str; 23] = [
+    "klein_bottle",
+    "astroid",
+    "astroid2",
+    "astrodal_torus",
+    "bohemian_dome",
+    "boy_shape",
+    "breather",
+    "enneper",
+    "figure8",
+    "henneberg",
+    "kiss",
+    "klein_bottle2",
+    "klein_bottle3",
+    "kuen",
+    "minimal",
+    "parabolic_cyclide",
+    "pear",
+    "plucker_conoid",
+    "seashell",
+    "sievert_enneper",
+    "steiner",
+    "torus",
+    "wellenkugel",
+];
+
 fn surface_type_map() -> HashMap<u32,String> {
-    let mut surface_type = HashMap::new();
-    surface_type.insert(0, String::from("klein_bottle"));
-    surface_type.insert(1, String::from("astroid"));
-    surface_type.insert(2, String::from("astroid2"));
-    surface_type.insert(3, String::from("astrodal_torus"));
-    surface_type.insert(4, String::from("bohemian_dome"));
-    surface_type.insert(5, String::from("boy_shape"));
-    surface_type.insert(6, String::from("breather"));
-    surface_type.insert(7, String::from("enneper"));
-    surface_type.insert(8, String::from("figure8"));
-    surface_type.insert(9, String::from("henneberg"));
-    surface_type.insert(10, String::from("kiss"),);
-    surface_type.insert(11, String::from("klein_bottle2"));
-    surface_type.insert(12, String::from("klein_bottle3"));
-    surface_type.insert(13, String::from("kuen"));
-    surface_type.insert(14, String::from("minimal"));
-    surface_type.insert(15, String::from("parabolic_cyclide"));
-    surface_type.insert(16, String::from("pear"));
-    surface_type.insert(17, String::from("plucker_conoid"));
-    surface_type.insert(18, String::from("seashell"));
-    surface_type.insert(19, String::from("sievert_enneper"));
-    surface_type.insert(20, String::from("steiner"));
-    surface_type.insert(21, String::from("torus"));
-    surface_type.insert(22, String::from("wellenkugel"));
-    surface_type
+    SURFACE_TYPES.iter().enumerate().map(|(i, s)| (i as u32, s.to_string())).collect()
 }
 
 pub fn get_surface_type(key:u32) -> String {
-    let map = surface_type_map();
-    map.get(&key).map(|s| s.to_string()).unwrap_or_default()
+    SURFACE_TYPES.get(key as usize).map(|s| s.to_string()).unwrap_or_default()
 }
 
 impl Default for IParametricSurface {
@@ -99,84 +100,42 @@ impl Default for IParametricSurface {
 
 impl IParametricSurface {
     pub fn new(&mut self) -> ISurfaceOutput {
-        if self.surface_type == 1 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (0.0, 2.0*PI, 0.0, 2.0*PI);
-            self.parametric_surface_data(&mf::astroid)
-        } else if self.surface_type == 2 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (0.0, 2.0*PI, 0.0, 2.0*PI);
-            self.parametric_surface_data(&mf::astroid2)
-        } else if self.surface_type == 3 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (-PI, PI, 0.0, 5.0);
-            self.parametric_surface_data(&mf::astroidal_torus)
-        } else if self.surface_type == 4 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (0.0, 2.0*PI, 0.0, 2.0*PI);
-            self.parametric_surface_data(&mf::bohemian_dome)
-        } else if self.surface_type == 5 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (0.0, PI, 0.0, PI);
-            self.parametric_surface_data(&mf::boy_shape)
-        } else if self.surface_type == 6 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (-14.0, 14.0, -12.0*PI, 12.0*PI);
-            self.parametric_surface_data(&mf::breather)
-        } else if self.surface_type == 7 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (-3.3, 3.3, -3.3, 3.3);
-            self.parametric_surface_data(&mf::enneper)
-        } else if self.surface_type == 8 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (0.0, 4.0*PI, 0.0, 2.0*PI);
-            self.parametric_surface_data(&mf::figure8)
-        } else if self.surface_type == 9 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (0.0, 1.0, 0.0, 2.0*PI);
-            self.parametric_surface_data(&mf::henneberg)
-        } else if self.surface_type == 10 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (-0.99999, 0.99999, 0.0, 2.0*PI);
-            self.parametric_surface_data(&mf::kiss)
-        } else if self.surface_type == 11 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (0.0, 2.0*PI, 0.0, 2.0*PI);
-            self.parametric_surface_data(&mf::klein_bottle2)
-        } else if self.surface_type == 12 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (0.0, 4.0*PI, 0.0, 2.0*PI);
-            self.parametric_surface_data(&mf::klein_bottle3)
-        } else if self.surface_type == 13 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (-4.5, 4.5, -5.0, 5.0);
-            self.parametric_surface_data(&mf::kuen)
-        } else if self.surface_type == 14 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (-3.0, 1.0, -3.0*PI, 3.0*PI);
-            self.parametric_surface_data(&mf::minimal)
-        } else if self.surface_type == 15 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (-5.0, 5.0, -5.0, 5.0);
-            self.parametric_surface_data(&mf::parabolic_cyclide)
-        } else if self.surface_type == 16 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (0.0, 1.0, 0.0, 2.0*PI);
-            self.parametric_surface_data(&mf::pear)
-        } else if self.surface_type == 17 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (-2.0, 2.0, 0.0, 2.0*PI);
-            self.parametric_surface_data(&mf::plucker_conoid)
-        } else if self.surface_type == 18 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (0.0, 6.0*PI, 0.0, 2.0*PI);
-            self.parametric_surface_data(&mf::seashell)
-        } else if self.surface_type == 19 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (-PI/2.1, PI/2.1, 0.001, PI/1.001);
-            self.parametric_surface_data(&mf::sievert_enneper)
-        } else if self.surface_type == 20 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (0.0, 1.999999*PI, 0.0, 0.999999*PI);
-            self.parametric_surface_data(&mf::steiner)
-        } else if self.surface_type == 21 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (0.0, 2.0*PI, 0.0, 2.0*PI);
-            self.parametric_surface_data(&mf::torus)
-        } else if self.surface_type == 22 {
-            (self.umin, self.umax, self.vmin, self.vmax) = (0.0, 14.5, 0.0, 5.2);
-            self.parametric_surface_data(&mf::wellenkugel)
-        } else {
-            (self.umin, self.umax, self.vmin, self.vmax) = (0.0, PI, 0.0, 2.0*PI);
-            self.parametric_surface_data(&mf::klein_bottle)
-        }
+        let (range, f): ((f32, f32, f32, f32), fn(f32, f32) -> [f32; 3]) = match self.surface_type {
+            1 => ((0.0, 2.0*PI, 0.0, 2.0*PI), mf::astroid),
+            2 => ((0.0, 2.0*PI, 0.0, 2.0*PI), mf::astroid2),
+            3 => ((-PI, PI, 0.0, 5.0), mf::astroidal_torus),
+            4 => ((0.0, 2.0*PI, 0.0, 2.0*PI), mf::bohemian_dome),
+            5 => ((0.0, PI, 0.0, PI), mf::boy_shape),
+            6 => ((-14.0, 14.0, -12.0*PI, 12.0*PI), mf::breather),
+            7 => ((-3.3, 3.3, -3.3, 3.3), mf::enneper),
+            8 => ((0.0, 4.0*PI, 0.0, 2.0*PI), mf::figure8),
+            9 => ((0.0, 1.0, 0.0, 2.0*PI), mf::henneberg),
+            10 => ((-0.99999, 0.99999, 0.0, 2.0*PI), mf::kiss),
+            11 => ((0.0, 2.0*PI, 0.0, 2.0*PI), mf::klein_bottle2),
+            12 => ((0.0, 4.0*PI, 0.0, 2.0*PI), mf::klein_bottle3),
+            13 => ((-4.5, 4.5, -5.0, 5.0), mf::kuen),
+            14 => ((-3.0, 1.0, -3.0*PI, 3.0*PI), mf::minimal),
+            15 => ((-5.0, 5.0, -5.0, 5.0), mf::parabolic_cyclide),
+            16 => ((0.0, 1.0, 0.0, 2.0*PI), mf::pear),
+            17 => ((-2.0, 2.0, 0.0, 2.0*PI), mf::plucker_conoid),
+            18 => ((0.0, 6.0*PI, 0.0, 2.0*PI), mf::seashell),
+            19 => ((-PI/2.1, PI/2.1, 0.001, PI/1.001), mf::sievert_enneper),
+            20 => ((0.0, 1.999999*PI, 0.0, 0.999999*PI), mf::steiner),
+            21 => ((0.0, 2.0*PI, 0.0, 2.0*PI), mf::torus),
+            22 => ((0.0, 14.5, 0.0, 5.2), mf::wellenkugel),
+            _ => ((0.0, PI, 0.0, 2.0*PI), mf::klein_bottle),
+        };
+        (self.umin, self.umax, self.vmin, self.vmax) = range;
+        self.parametric_surface_data(&f)
     }
 
     fn parametric_surface_data(&mut self, f:&dyn Fn(f32, f32) -> [f32; 3]) -> ISurfaceOutput {
-        let mut positions: Vec<[f32; 3]> = vec![];
-        let mut normals: Vec<[f32; 3]> = vec![];
-        let mut colors: Vec<[f32; 3]> = vec![];
-        let mut colors2: Vec<[f32; 3]> = vec![];
-        let mut uvs: Vec<[f32; 2]> = vec![];
+        let n_vertices = (self.u_resolution as usize + 1) * (self.v_resolution as usize + 1);
+        let mut positions: Vec<[f32; 3]> = Vec::with_capacity(n_vertices);
+        let mut normals: Vec<[f32; 3]> = Vec::with_capacity(n_vertices);
+        let mut colors: Vec<[f32; 3]> = Vec::with_capacity(n_vertices);
+        let mut colors2: Vec<[f32; 3]> = Vec::with_capacity(n_vertices);
+        let mut uvs: Vec<[f32; 2]> = Vec::with_capacity(n_vertices);
 
         let du = (self.umax - self.umin)/self.u_resolution as f32;
         let dv = (self.vmax - self.vmin)/self.v_resolution as f32;
@@ -191,7 +150,8 @@ impl IParametricSurface {
             let u = self.umin + du * i as f32;
             for j in 0..=self.v_resolution {
                 let v = self.vmin + dv * j as f32;                
-                positions.push(pts[i as usize][j as usize]);
+                let pt = pts[i as usize * (self.v_resolution as usize + 1) + j as usize];
+                positions.push(pt);
 
                 // calculate normals
                 /*p0 = Vector3::from(f(u, v));
@@ -218,9 +178,9 @@ impl IParametricSurface {
 
                 // colormap
                 let color = colormap::color_lerp(cdata, min_val, max_val, 
-                    pts[i as usize][j as usize][self.colormap_direction as usize]);
+                    pt[self.colormap_direction as usize]);
                 let color2 = colormap::color_lerp(cdata2, min_val, max_val, 
-                    pts[i as usize][j as usize][self.colormap_direction as usize]);
+                    pt[self.colormap_direction as usize]);
                 colors.push(color);
                 colors2.push(color2);
 
@@ -232,8 +192,10 @@ impl IParametricSurface {
         }
 
         // calculate indices
-        let mut indices: Vec<u16> = vec![];
-        let mut indices2: Vec<u16> = vec![];
+        let n_quads = self.u_resolution as usize * self.v_resolution as usize;
+        let n_edges = (self.u_resolution as usize + self.v_resolution as usize).saturating_sub(1);
+        let mut indices: Vec<u16> = Vec::with_capacity(6 * n_quads);
+        let mut indices2: Vec<u16> = Vec::with_capacity(4 * (n_quads + n_edges));
         let vertices_per_row = self.v_resolution + 1;
 
         for i in 0..self.u_resolution {
@@ -243,14 +205,11 @@ impl IParametricSurface {
                 let idx2 = j + 1 + (i + 1) * vertices_per_row;
                 let idx3 = j + (i + 1) * vertices_per_row; 
 
-                let values:Vec<u16> = vec![idx0, idx1, idx2, idx2, idx3, idx0];
-                indices.extend(values);
+                indices.extend_from_slice(&[idx0, idx1, idx2, idx2, idx3, idx0]);
 
-                let values2:Vec<u16> = vec![idx0, idx1, idx0, idx3];
-                indices2.extend(values2);
+                indices2.extend_from_slice(&[idx0, idx1, idx0, idx3]);
                 if i == self.u_resolution - 1 || j == self.v_resolution - 1 {
-                    let edge_values:Vec<u16> = vec![idx1, idx2, idx2, idx3];
-                    indices2.extend(edge_values);
+                    indices2.extend_from_slice(&[idx1, idx2, idx2, idx3]);
                 }
             }
         }
@@ -258,16 +217,17 @@ impl IParametricSurface {
         ISurfaceOutput { positions, normals, colors, colors2, uvs, indices, indices2 }
     }
 
-    fn parametric_surface_range(&mut self, f:&dyn Fn(f32, f32) -> [f32; 3]) -> (f32, f32, Vec<Vec<[f32;3]>>) {
+    fn parametric_surface_range(&mut self, f:&dyn Fn(f32, f32) -> [f32; 3]) -> (f32, f32, Vec<[f32;3]>) {
         let du = (self.umax - self.umin)/self.u_resolution as f32;
         let dv = (self.vmax - self.vmin)/self.v_resolution as f32;
         let (mut xmin, mut ymin, mut zmin) = (f32::MAX, f32::MAX, f32::MAX);
         let (mut xmax, mut ymax, mut zmax) = (f32::MIN, f32::MIN, f32::MIN);       
 
-        let mut pts: Vec<Vec<[f32; 3]>> = vec![];
+        // points are stored row by row: index = i * (v_resolution + 1) + j
+        let mut pts: Vec<[f32; 3]> = Vec::with_capacity(
+            (self.u_resolution as usize + 1) * (self.v_resolution as usize + 1));
         for i in 0..=self.u_resolution {
             let u = self.umin + du * i as f32;
-            let mut pt1: Vec<[f32; 3]> = vec![];
             for j in 0..=self.v_resolution {
                 let v = self.vmin + dv * j as f32;
                 let pt = f(u, v);
@@ -277,25 +237,20 @@ impl IParametricSurface {
                 ymax = if pt[1] > ymax { pt[1] } else { ymax };
                 zmin = if pt[2] < zmin { pt[2] } else { zmin };
                 zmax = if pt[2] > zmax { pt[2] } else { zmax };
-                pt1.push(pt);
+                pts.push(pt);
             }
-            pts.push(pt1);
         }
 
         let (mut min_val, mut max_val) = (f32::MAX, f32::MIN);
         let dist = (xmax - xmin).max(ymax - ymin).max(zmax - zmin);
 
-        for i in 0..=self.u_resolution {
-            for j in 0..=self.v_resolution {
-                let mut pt = pts[i as usize][j as usize];
-                pt[0] = self.scale * (pt[0] - 0.5 * (xmin + xmax)) / dist;
-                pt[1] = self.scale * (pt[1] - 0.5 * (ymin + ymax)) / dist;
-                pt[2] = self.scale * (pt[2] - 0.5 * (zmin + zmax)) / dist;
-                let pt1 = pt[self.colormap_direction as usize];
-                min_val = if pt1 < min_val { pt1 } else { min_val };
-                max_val = if pt1 > max_val { pt1 } else { max_val };
-                pts[i as usize][j as usize] = pt;
-            }
+        for pt in pts.iter_mut() {
+            pt[0] = self.scale * (pt[0] - 0.5 * (xmin + xmax)) / dist;
+            pt[1] = self.scale * (pt[1] - 0.5 * (ymin + ymax)) / dist;
+            pt[2] = self.scale * (pt[2] - 0.5 * (zmin + zmax)) / dist;
+            let pt1 = pt[self.colormap_direction as usize];
+            min_val = if pt1 < min_val { pt1 } else { min_val };
+            max_val = if pt1 > max_val { pt1 } else { max_val };
         }
         (min_val, max_val, pts)
     }
@@ -359,11 +314,12 @@ impl ISimpleSurface {
     }
 
     fn simple_surface_data(&mut self, f:&dyn Fn(f32, f32, f32) -> [f32; 3]) -> ISurfaceOutput {
-        let mut positions: Vec<[f32; 3]> = vec![];
-        let mut normals: Vec<[f32; 3]> = vec![];
-        let mut colors: Vec<[f32; 3]> = vec![];
-        let mut colors2: Vec<[f32; 3]> = vec![];
-        let mut uvs: Vec<[f32; 2]> = vec![];
+        let n_vertices = (self.x_resolution as usize + 1) * (self.z_resolution as usize + 1);
+        let mut positions: Vec<[f32; 3]> = Vec::with_capacity(n_vertices);
+        let mut normals: Vec<[f32; 3]> = Vec::with_capacity(n_vertices);
+        let mut colors: Vec<[f32; 3]> = Vec::with_capacity(n_vertices);
+        let mut colors2: Vec<[f32; 3]> = Vec::with_capacity(n_vertices);
+        let mut uvs: Vec<[f32; 2]> = Vec::with_capacity(n_vertices);
         
         let dx = (self.xmax- self.xmin) / self.x_resolution as f32;
         let dz = (self.zmax - self.zmin) / self.z_resolution as f32;
@@ -406,8 +362,10 @@ impl ISimpleSurface {
         }
 
         // calculate indices
-        let mut indices: Vec<u16> = vec![];
-        let mut indices2: Vec<u16> = vec![];
+        let n_quads = self.x_resolution as usize * self.z_resolution as usize;
+        let n_edges = (self.x_resolution as usize + self.z_resolution as usize).saturating_sub(1);
+        let mut indices: Vec<u16> = Vec::with_capacity(6 * n_quads);
+        let mut indices2: Vec<u16> = Vec::with_capacity(4 * (n_quads + n_edges));
         let vertices_per_row = self.z_resolution + 1;
 
         for i in 0..self.x_resolution {
@@ -417,14 +375,11 @@ impl ISimpleSurface {
                 let idx2 = j + 1 + (i + 1) * vertices_per_row;
                 let idx3 = j + (i + 1) * vertices_per_row; 
 
-                let values:Vec<u16> = vec![idx0, idx1, idx2, idx2, idx3, idx0];
-                indices.extend(values);
+                indices.extend_from_slice(&[idx0, idx1, idx2, idx2, idx3, idx0]);
 
-                let values2:Vec<u16> = vec![idx0, idx1, idx0, idx3];
-                indices2.extend(values2);
+                indices2.extend_from_slice(&[idx0, idx1, idx0, idx3]);
                 if i == self.x_resolution - 1 || j == self.z_resolution - 1 {
-                    let edge_values:Vec<u16> = vec![idx1, idx2, idx2, idx3];
-                    indices2.extend(edge_values);
+                    indices2.extend_from_slice(&[idx1, idx2, idx2, idx3]);
                 }
             }
         }
@@ -30,8 +30,8 @@ pub fn create_torus_data(r_torus:f32, r_tube:f32, n_torus:u16, n_tube:u16)
         }
     }
 
-    let mut indices: Vec<u16> = vec![];
-    let mut indices2: Vec<u16> = vec![];
+    let mut indices: Vec<u16> = Vec::with_capacity(6 * n_torus as usize * n_tube as usize);
+    let mut indices2: Vec<u16> = Vec::with_capacity(4 * n_torus as usize * n_tube as usize);
     let vertices_per_row = n_tube + 1;
 
     for i in 0..n_torus {
@@ -40,10 +40,8 @@ pub fn create_torus_data(r_torus:f32, r_tube:f32, n_torus:u16, n_tube:u16)
             let idx1 = j + 1 + i * vertices_per_row;
             let idx2 = j + 1 + (i + 1) * vertices_per_row;
             let idx3 = j + (i + 1) * vertices_per_row; 
-            let values:Vec<u16> = vec![idx0, idx1, idx2, idx2, idx3, idx0];
-            indices.extend(values);
-            let values2:Vec<u16> = vec![idx0, idx1, idx0, idx3];
-            indices2.extend(values2);
+            indices.extend_from_slice(&[idx0, idx1, idx2, idx2, idx3, idx0]);
+            indices2.extend_from_slice(&[idx0, idx1, idx0, idx3]);
         }
     }
 
@@ -62,19 +60,18 @@ pub fn create_cylinder_data(mut rin:f32, rout:f32, h:f32, n:u16) -> (Vec<[f32; 3
         rin = 0.999 * rout; 
     }
 
-    let mut positions: Vec<[f32; 3]> = vec![];
+    let mut positions: Vec<[f32; 3]> = Vec::with_capacity(4 * (n as usize + 1));
     for i in 0..=n {
         let theta = i as f32 * 360.0/n as f32;
         let p0 = cylinder_position(rout, Deg(theta), h/2.0);
         let p1 = cylinder_position(rout, Deg(theta), -h/2.0);
         let p2 = cylinder_position(rin, Deg(theta), -h/2.0);
         let p3 = cylinder_position(rin, Deg(theta), h/2.0);
-        let values:Vec<[f32; 3]> = vec![p0, p1, p2, p3];
-        positions.extend(values);
+        positions.extend_from_slice(&[p0, p1, p2, p3]);
     }
 
-    let mut indices: Vec<u16> = vec![];
-    let mut indices2: Vec<u16> = vec![];
+    let mut indices: Vec<u16> = Vec::with_capacity(24 * n as usize);
+    let mut indices2: Vec<u16> = Vec::with_capacity(16 * n as usize);
 
     for i in 0..n {
         let idx0 = i*4;
@@ -87,21 +84,19 @@ pub fn create_cylinder_data(mut rin:f32, rout:f32, h:f32, n:u16) -> (Vec<[f32; 3
         let idx7 = i*4 + 7;
 
         // triangle indices
-        let values: Vec<u16> = vec![
+        indices.extend_from_slice(&[
             idx0, idx4, idx7, idx7, idx3, idx0, // top
             idx1, idx2, idx6, idx6, idx5, idx1, // bottom
             idx0, idx1, idx5, idx5, idx4, idx0, // outer
             idx2, idx3, idx7, idx7, idx6, idx2  // inner
-        ];
-        indices.extend(values);
+        ]);
 
         // wireframe indices
-        let values2: Vec<u16> = vec![
+        indices2.extend_from_slice(&[
             idx0, idx3, idx3, idx7, idx4, idx0, // top
             idx1, idx2, idx2, idx6, idx5, idx1, // bottom
             idx0, idx1, idx3, idx2              // side
-        ];
-        indices2.extend(values2);
+        ]);
     }
 
     (positions, indices, indices2)
@@ -131,8 +126,8 @@ pub fn create_sphere_data(r:f32, u:u16, v:u16) ->
         }
     }
 
-    let mut indices: Vec<u16> = vec![];
-    let mut indices2: Vec<u16> = vec![];
+    let mut indices: Vec<u16> = Vec::with_capacity(6 * u as usize * v as usize);
+    let mut indices2: Vec<u16> = Vec::with_capacity(4 * u as usize * v as usize);
     
     for i in 0..u {
         for j in 0..v {
@@ -141,11 +136,9 @@ pub fn create_sphere_data(r:f32, u:u16, v:u16) ->
             let idx2 = j + 1 + (i + 1) * (v as u16 + 1);
             let idx3 = j + (i + 1) * (v as u16 + 1);
 
-            let values: Vec<u16> = vec![idx0, idx1, idx2, idx2, idx3, idx0];
-            indices.extend(values); 
+            indices.extend_from_slice(&[idx0, idx1, idx2, idx2, idx3, idx0]);
            
-            let values2: Vec<u16> = vec![idx0, idx1, idx0, idx3];
-            indices2.extend(values2); 
+            indices2.extend_from_slice(&[idx0, idx1, idx0, idx3]);
         }
     }
 